@@ -1,67 +1,271 @@
 """PyDroidIPCam API for the Android IP Webcam app."""
 
 import asyncio
-from typing import Any, Dict, List, Optional, Union, cast, Literal
+import json
+import re
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Literal,
+)
 
 import aiohttp
 from yarl import URL
 
 from .exceptions import CannotConnect, PyDroidIPCamException, Unauthorized
 
-ALLOWED_ORIENTATIONS = ["landscape", "upsidedown", "portrait", "upsidedown_portrait"]
+# The alias is annotated explicitly so the module typechecks the same
+# whether or not orjson is installed.
+json_loads: Callable[..., Any]
+try:
+    # C-implemented parser, noticeably faster on large sensor payloads.
+    import orjson
+except ImportError:
+    json_loads = json.loads
+else:
+    json_loads = orjson.loads
+
+ALLOWED_ORIENTATIONS: FrozenSet[str] = frozenset(
+    {"landscape", "upsidedown", "portrait", "upsidedown_portrait"}
+)
+
+_BOOL_MAP = {"on": True, "off": False}
+_BOOL_PAYLOAD = ("off", "on")
+
+_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?$").match
+
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 60.0
+
+# Control endpoint paths, indexed by the requested state.
+_TORCH_PATHS = ("/disabletorch", "/enabletorch")
+_FOCUS_PATHS = ("/nofocus", "/focus")
+
+
+def _parse_setting_value(val: Any) -> Any:
+    """Convert a raw setting value to bool or float where possible.
+
+    Most values are non-numeric strings, so match against a compiled
+    numeric pattern and only then call float(), instead of paying for a
+    raised ValueError on every value.
+    """
+    if isinstance(val, (int, float)):
+        return float(val)
+
+    bool_val = _BOOL_MAP.get(val)
+    if bool_val is not None:
+        return bool_val
+
+    if _NUM_RE(val):
+        return float(val)
+
+    return val
 
 
 class PyDroidIPCam:
-    """The Android device running IP Webcam."""
+    """The Android device running IP Webcam.
+
+    Pass a shared aiohttp.ClientSession so keep-alive connections are
+    reused across polls and settings calls, or use create() to let the
+    object build and own a session with a tuned connector.
+    """
+
+    __slots__ = (
+        "websession",
+        "status_data",
+        "sensor_data",
+        "base_url",
+        "mjpeg_url",
+        "audio_wav_url",
+        "audio_aac_url",
+        "audio_opus_url",
+        "h264_url",
+        "image_url",
+        "_owns_session",
+        "_current_settings_cache",
+        "_available_settings_cache",
+        "_enabled_settings_cache",
+        "_enabled_sensors_cache",
+        "_scenemodes_cache",
+        "_sensor_values",
+        "_sensor_units",
+        "_host",
+        "_port",
+        "_auth",
+        "_timeout",
+        "_ssl",
+        "_consecutive_failures",
+        "_unavailable_until",
+        "_min_poll_interval",
+        "_last_update",
+        "_cache_ttl",
+        "_json_cache",
+        "_rtsp_base",
+        "_status_url",
+        "_status_sensors_url",
+        "_sensors_url",
+        "_supports_combined",
+        "_settings_url",
+        "_setting_urls",
+        "_ptz_url",
+        "_startvideo_url",
+        "_stopvideo_url",
+        "_shot_url",
+        "_update_task",
+    )
 
     def __init__(
         self,
-        websession: aiohttp.ClientSession,
+        websession: Optional[aiohttp.ClientSession],
         host: str,
         port: int = 8080,
         username: Optional[str] = None,
         password: Optional[str] = None,
-        timeout: int = 10,
+        timeout: Union[int, aiohttp.ClientTimeout] = 10,
         ssl: bool = True,
+        *,
+        min_poll_interval: float = 0.0,
+        cache_ttl: float = 0.0,
     ):
-        """Initialize the data object."""
-        self.websession: aiohttp.ClientSession = websession
+        """Initialize the data object.
+
+        min_poll_interval throttles update(): calls arriving within that
+        many seconds of the last successful poll reuse the data already
+        stored instead of hitting the camera again. cache_ttl does the
+        same per JSON endpoint, so the status and sensor fetches reuse a
+        recently parsed payload; mutating endpoints are never cached.
+
+        If websession is None, a session with a keep-alive timeout that
+        outlives typical polling intervals is created on the first
+        request and owned by this object; call close() when done with
+        it. Building it lazily keeps the constructor and create()
+        callable outside a running event loop.
+        """
+        self._owns_session: bool = websession is None
+        self.websession: Optional[aiohttp.ClientSession] = websession
+        self._current_settings_cache: Optional[Dict[str, Any]] = None
+        self._available_settings_cache: Optional[Dict[str, List[Any]]] = None
+        self._enabled_settings_cache: Optional[List[str]] = None
+        self._enabled_sensors_cache: Optional[List[str]] = None
+        self._scenemodes_cache: Optional[FrozenSet[str]] = None
         self.status_data: Dict[str, Any] = {}
         self.sensor_data: Dict[str, Dict[str, Any]] = {}
+        self._sensor_values: Dict[str, Union[str, int, float, None]] = {}
+        self._sensor_units: Dict[str, Optional[str]] = {}
         self._host: str = host
         self._port: int = port
         self._auth: Optional[aiohttp.BasicAuth] = None
-        self._timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=timeout)
+        # Split the budget per phase so a dead camera fails on connect
+        # quickly and a stalled read does not linger until total expiry.
+        # A ClientTimeout instance is taken as-is for per-deployment tuning.
+        if isinstance(timeout, aiohttp.ClientTimeout):
+            self._timeout: aiohttp.ClientTimeout = timeout
+        else:
+            self._timeout = aiohttp.ClientTimeout(
+                total=timeout, connect=min(3, timeout), sock_read=timeout
+            )
         self._ssl: bool = ssl
+        self._consecutive_failures: int = 0
+        self._unavailable_until: float = 0.0
+        self._min_poll_interval: float = min_poll_interval
+        self._last_update: float = 0.0
+        self._cache_ttl: float = cache_ttl
+        self._json_cache: Dict[URL, Tuple[float, Any]] = {}
+        self._update_task: Optional["asyncio.Task[None]"] = None
+        # Whether the server answers status and sensors in one round-trip;
+        # probed on the first update().
+        self._supports_combined: Optional[bool] = None
 
         if username and password:
             self._auth = aiohttp.BasicAuth(username, password=password)
 
-    @property
-    def base_url(self) -> str:
-        """Return the base URL for endpoints."""
-        protocol = "https" if self._ssl else "http"
-        return f"{protocol}://{self._host}:{self._port}"
-
-    @property
-    def mjpeg_url(self) -> str:
-        """Return mjpeg url."""
-        return f"{self.base_url}/video"
+        self._build_urls()
 
-    @property
-    def audio_wav_url(self) -> str:
-        """Return url that Waveform audio can be streamed from."""
-        return f"{self.base_url}/audio.wav"
+    def _build_urls(self) -> None:
+        """Build all endpoint URLs once.
 
-    @property
-    def audio_aac_url(self) -> str:
-        """Return url that AAC audio can be streamed from."""
-        return f"{self.base_url}/audio.aac"
+        Host, port and protocol are immutable after construction, so
+        both the public URL strings and the prebuilt yarl URLs (which
+        spare aiohttp a fresh string parse on every call) are computed
+        here instead of on every access.
+        """
+        protocol = "https" if self._ssl else "http"
+        rtsp_protocol = "rtsps" if self._ssl else "rtsp"
+        #: Base URL for endpoints.
+        self.base_url: str = f"{protocol}://{self._host}:{self._port}"
+        self._rtsp_base: str = f"{rtsp_protocol}://{self._host}:{self._port}/"
+        #: URL of the mjpeg stream.
+        self.mjpeg_url: str = self.base_url + "/video"
+        #: URL that Waveform audio can be streamed from.
+        self.audio_wav_url: str = self.base_url + "/audio.wav"
+        #: URL that AAC audio can be streamed from.
+        self.audio_aac_url: str = self.base_url + "/audio.aac"
+        #: URL that LibOPUS audio can be streamed from.
+        self.audio_opus_url: str = self.base_url + "/audio.opus"
+        #: URL of the h264 RTSP stream.
+        self.h264_url: str = self.get_rtsp_url("h264", "pcm")
+        #: URL of the snapshot image.
+        self.image_url: str = self.base_url + "/shot.jpg"
+
+        base = URL(self.base_url)
+        self._status_url: URL = (base / "status.json").with_query(show_avail=1)
+        self._status_sensors_url: URL = (base / "status.json").with_query(
+            show_avail=1, show_sensors=1
+        )
+        self._sensors_url: URL = base / "sensors.json"
+        self._settings_url: URL = base / "settings"
+        self._setting_urls: Dict[str, URL] = {}
+        self._ptz_url: URL = self._settings_url / "ptz"
+        self._startvideo_url: URL = (base / "startvideo").with_query(force=1)
+        self._stopvideo_url: URL = (base / "stopvideo").with_query(force=1)
+        self._shot_url: URL = base / "shot.jpg"
+
+    @classmethod
+    def create(
+        cls,
+        host: str,
+        websession: Optional[aiohttp.ClientSession] = None,
+        port: int = 8080,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: Union[int, aiohttp.ClientTimeout] = 10,
+        ssl: bool = True,
+        *,
+        min_poll_interval: float = 0.0,
+        cache_ttl: float = 0.0,
+    ) -> "PyDroidIPCam":
+        """Create a camera object, building a websession if none is given.
+
+        The internally created session uses a keep-alive timeout that
+        outlives typical polling intervals, so consecutive requests reuse
+        the pooled TCP/TLS connection instead of re-handshaking. It is
+        built on the first request, so calling create() outside a
+        running event loop is fine. Call close() when done with an
+        object created this way.
+        """
+        return cls(
+            websession,
+            host,
+            port=port,
+            username=username,
+            password=password,
+            timeout=timeout,
+            ssl=ssl,
+            min_poll_interval=min_poll_interval,
+            cache_ttl=cache_ttl,
+        )
 
-    @property
-    def audio_opus_url(self) -> str:
-        """Return url that LibOPUS audio can be streamed from."""
-        return f"{self.base_url}/audio.opus"
+    async def close(self) -> None:
+        """Close the websession if this object owns it."""
+        if self._owns_session and self.websession is not None:
+            await self.websession.close()
 
     def get_rtsp_url(
         self,
@@ -72,156 +276,334 @@ class PyDroidIPCam:
 
         Use the developer-recommended h264 & opus if no arguments are supplied.
         """
-        rtsp_protocol = "rtsps" if self._ssl else "rtsp"
-        return (
-            f"{rtsp_protocol}://{self._host}:{self._port}/"
-            f"{video_codec}_{audio_codec}.sdp"
-        )
+        return self._rtsp_base + f"{video_codec}_{audio_codec}.sdp"
 
-    @property
-    def h264_url(self) -> str:
-        """Return h264 url."""
-        return self.get_rtsp_url("h264", "pcm")
+    async def _request(self, url: Union[str, URL]) -> bytes:
+        """Make the actual request and return the raw response body.
 
-    @property
-    def image_url(self) -> str:
-        """Return snapshot image URL."""
-        return f"{self.base_url}/shot.jpg"
-
-    async def _request(self, path: str) -> aiohttp.ClientResponse:
-        """Make the actual request and return the parsed response."""
-        url: str = f"{self.base_url}{path}"
+        The body is read inside the context manager, so the pooled
+        connection is always released back to the session.
+        """
+        if time.monotonic() < self._unavailable_until:
+            # Fail locally instead of burning a full connect timeout while
+            # the camera is known to be unreachable.
+            raise CannotConnect("Waiting out backoff after repeated failures")
+
+        if isinstance(url, str):
+            url = self.base_url + url
+
+        if self.websession is None:
+            # aiohttp needs a running event loop to build a session, so
+            # an owned session is created on first use rather than in
+            # the constructor.
+            self.websession = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    keepalive_timeout=75, limit=10, limit_per_host=4
+                )
+            )
 
         try:
-            response = await self.websession.get(
+            async with self.websession.get(
                 url, auth=self._auth, timeout=self._timeout, raise_for_status=True
-            )
+            ) as response:
+                body: bytes = await response.read()
 
         except aiohttp.ClientResponseError as error:
             if error.status == 401:
+                # The camera answered, so this is a credential problem,
+                # not a connectivity one: keep the backoff disarmed so
+                # callers see Unauthorized on every retry instead of a
+                # masking CannotConnect from the cooldown.
                 raise Unauthorized("Incorrect username or password") from error
-            raise PyDroidIPCamException(
-                f"code: {error.code}, error: {error.message}"
-            ) from error
+            self._handle_failure()
+            raise PyDroidIPCamException(error.status, error.message) from error
         except (asyncio.TimeoutError, aiohttp.ClientError) as error:
+            self._handle_failure()
             raise CannotConnect(error) from error
 
-        return response
+        if self._consecutive_failures:
+            self._consecutive_failures = 0
+            self._unavailable_until = 0.0
+        return body
+
+    def _handle_failure(self) -> None:
+        """Record a failed request and start the backoff cooldown."""
+        self._consecutive_failures += 1
+        self._unavailable_until = time.monotonic() + self.next_retry_after
+
+    @property
+    def available(self) -> bool:
+        """Return whether the camera answered its most recent request.
+
+        Derived from the failure tracking instead of a dedicated flag, so
+        the request hot path carries no extra attribute writes.
+        """
+        return self._consecutive_failures == 0
+
+    @property
+    def next_retry_after(self) -> float:
+        """Return seconds a poller should wait before the next attempt.
+
+        Grows exponentially with consecutive request failures, so an
+        unreachable camera is not hammered at full poll rate. Zero while
+        the camera is healthy.
+        """
+        if not self._consecutive_failures:
+            return 0.0
+        return min(
+            _BACKOFF_MAX, _BACKOFF_BASE * 2.0 ** (self._consecutive_failures - 1)
+        )
+
+    async def _get_json(self, url: URL, cache: bool = False) -> Any:
+        """Request a JSON endpoint and return the parsed payload.
+
+        With cache=True the parsed payload is reused for cache_ttl
+        seconds, sparing the HTTP round-trip and the parse. Only the
+        idempotent status/sensor GETs opt in.
+        """
+        if cache and self._cache_ttl:
+            entry = self._json_cache.get(url)
+            if entry and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+
+        data = json_loads(await self._request(url))
+        if cache and self._cache_ttl:
+            self._json_cache[url] = (time.monotonic(), data)
+        return data
+
+    async def _ok_request(self, url: Union[str, URL]) -> bool:
+        """Request a control endpoint and return whether it answered Ok.
+
+        The check runs on the raw bytes, skipping the charset detection
+        and str allocation of response.text() for the tiny Ok bodies.
+        """
+        return (await self._request(url)).startswith(b"Ok")
 
     async def update(self) -> None:
-        """Fetch the latest data from IP Webcam."""
-        response = await self._request("/status.json?show_avail=1")
-        self.status_data = cast(Dict[str, Any], await response.json())
+        """Fetch the latest data from IP Webcam.
+
+        Only the most recent sample per sensor is retained in
+        sensor_data; historical samples are discarded. Concurrent calls
+        are coalesced: while a poll is in flight, further callers await
+        the same fetch instead of issuing duplicate requests.
+        """
+        if self._min_poll_interval and (
+            time.monotonic() - self._last_update < self._min_poll_interval
+        ):
+            return
+
+        task = self._update_task
+        if task is None:
+            task = asyncio.ensure_future(self._do_update())
+            self._update_task = task
+            task.add_done_callback(self._clear_update_task)
+        # Every caller, the initiator included, awaits through a shield:
+        # cancelling one caller must not cancel the shared poll the
+        # other callers are still waiting on.
+        await asyncio.shield(task)
+
+    def _clear_update_task(self, _task: "asyncio.Task[None]") -> None:
+        """Free the single-flight slot once the shared poll finishes."""
+        self._update_task = None
+
+    async def _do_update(self) -> None:
+        """Run the actual status and sensor fetch."""
+        if self._supports_combined is not False:
+            # Shallow-copy so popping the sensors blob below cannot
+            # mutate a payload held in the JSON cache.
+            data = dict(await self._get_json(self._status_sensors_url, cache=True))
+            sensors = data.pop("sensors", None)
+            self._supports_combined = sensors is not None
+            self.status_data = data
+            self._clear_status_caches()
+            if sensors is None:
+                # Probe failed: the server ignored show_sensors, so fetch
+                # sensors separately this once and use the two-request
+                # path for all further polls.
+                sensors = await self._get_json(self._sensors_url, cache=True)
+            self._set_sensor_data(sensors)
+            self._last_update = time.monotonic()
+            return
+
+        status_data: Any
+        sensor_data: Any
+        status_data, sensor_data = await asyncio.gather(
+            self._get_json(self._status_url, cache=True),
+            self._get_json(self._sensors_url, cache=True),
+            return_exceptions=True,
+        )
 
-        response = await self._request("/sensors.json")
-        self.sensor_data = cast(Dict[str, Any], await response.json())
+        if isinstance(status_data, BaseException):
+            raise status_data
+        # Keep the status update even if the sensor fetch failed.
+        self.status_data = status_data
+        self._clear_status_caches()
+        if isinstance(sensor_data, BaseException):
+            raise sensor_data
+        self._set_sensor_data(sensor_data)
+        self._last_update = time.monotonic()
+
+    def _clear_status_caches(self) -> None:
+        """Drop derived views so they rebuild from fresh status data."""
+        self._current_settings_cache = None
+        self._available_settings_cache = None
+        self._enabled_settings_cache = None
+        self._scenemodes_cache = None
+
+    def _set_sensor_data(self, raw: Dict[str, Dict[str, Any]]) -> None:
+        """Store sensor data, compacted to unit plus latest sample.
+
+        The same pass fills flat value and unit lookup dicts, so the
+        per-sensor accessors are a single dict hit instead of walking the
+        nested node structure.
+        """
+        compact: Dict[str, Dict[str, Any]] = {}
+        values: Dict[str, Union[str, int, float, None]] = {}
+        units: Dict[str, Optional[str]] = {}
+
+        for name, node in raw.items():
+            data = node.get("data")
+            unit = node.get("unit")
+            units[name] = unit
+            if data:
+                compact[name] = {"unit": unit, "data": data[-1:]}
+                try:
+                    values[name] = data[-1][-1][0]
+                except (IndexError, TypeError):
+                    # A sample with an empty or malformed value list
+                    # must not fail the whole poll.
+                    values[name] = None
+            else:
+                compact[name] = node
+                values[name] = None
+
+        self.sensor_data = compact
+        self._sensor_values = values
+        self._sensor_units = units
+        self._enabled_sensors_cache = None
 
     @property
     def current_settings(self) -> Dict[str, Any]:
         """Return dict with all config included."""
+        if self._current_settings_cache is not None:
+            return self._current_settings_cache
+
         settings: Dict[str, Any] = {}
 
         for key, val in self.status_data.get("curvals", {}).items():
-            try:
-                val = float(val)
-            except ValueError:
-                pass
-
-            if val in ("on", "off"):
-                val = val == "on"
-
-            settings[key] = val
+            settings[key] = _parse_setting_value(val)
 
+        self._current_settings_cache = settings
         return settings
 
     @property
     def enabled_sensors(self) -> List[str]:
         """Return the enabled sensors."""
-        return list(self.sensor_data)
+        if self._enabled_sensors_cache is None:
+            self._enabled_sensors_cache = list(self.sensor_data)
+        return self._enabled_sensors_cache
 
     @property
     def enabled_settings(self) -> List[str]:
         """Return the enabled settings."""
-        return list(self.status_data.get("curvals", {}))
+        if self._enabled_settings_cache is None:
+            self._enabled_settings_cache = list(self.status_data.get("curvals", {}))
+        return self._enabled_settings_cache
 
     @property
     def available_settings(self) -> Dict[str, List[Any]]:
         """Return dict of lists with all available config settings."""
+        if self._available_settings_cache is not None:
+            return self._available_settings_cache
+
         available: Dict[str, List[Any]] = {}
 
         for key, val in self.status_data.get("avail", {}).items():
-            available[key] = []
-            for subval in val:
-                try:
-                    subval = float(subval)
-                except ValueError:
-                    pass
+            available[key] = [_parse_setting_value(subval) for subval in val]
 
-                if val in ("on", "off"):
-                    subval = subval == "on"
+        self._available_settings_cache = available
+        return available
 
-                available[key].append(subval)
+    async def snapshot(self) -> bytes:
+        """Return a JPEG snapshot as raw bytes.
 
-        return available
+        Uses the prebuilt snapshot URL and the pooled keep-alive
+        connection, making this the cheapest way to poll images.
+        """
+        return await self._request(self._shot_url)
 
     def get_sensor_value(self, sensor: str) -> Union[str, int, float, None]:
         """Return the value from a sensor node."""
-        if sensor_info := self.sensor_data.get(sensor):
-            if "data" in sensor_info:
-                return cast(Union[str, int, float], sensor_info["data"][-1][-1][0])
-        return None
+        return self._sensor_values.get(sensor)
 
     def get_sensor_unit(self, sensor: str) -> Optional[str]:
         """Return the unit from a sensor node."""
-        if sensor_info := self.sensor_data.get(sensor):
-            return cast(Optional[str], sensor_info.get("unit"))
-        return None
+        return self._sensor_units.get(sensor)
 
     async def change_setting(self, key: str, val: Union[str, int, bool]) -> bool:
         """Change a setting."""
-        payload: Union[str, int, None] = None
         if isinstance(val, bool):
-            payload = "on" if val else "off"
-        else:
-            payload = val
-        response = await self._request(f"/settings/{key}?set={payload}")
-        return "Ok" in (await response.text())
+            return await self._bool_setting(key, val)
+        return await self._ok_request(self._setting_url(key).with_query(set=val))
+
+    def _setting_url(self, key: str) -> URL:
+        """Return the settings URL for a key, built once per key."""
+        url = self._setting_urls.get(key)
+        if url is None:
+            url = self._setting_urls[key] = self._settings_url / key
+        return url
+
+    async def _bool_setting(self, key: str, activate: bool) -> bool:
+        """Change an on/off setting, skipping the payload type dispatch."""
+        return await self._ok_request(
+            self._setting_url(key).with_query(set=_BOOL_PAYLOAD[activate])
+        )
+
+    async def apply_settings(
+        self, **settings: Union[str, int, bool]
+    ) -> Dict[str, bool]:
+        """Change several settings concurrently.
+
+        The requests run in parallel on the pooled connections, so N
+        toggles cost roughly one round-trip instead of N. The order in
+        which the camera applies them is not guaranteed. Returns a dict
+        mapping each key to whether the camera acknowledged it.
+        """
+        results = await asyncio.gather(
+            *(self.change_setting(key, val) for key, val in settings.items())
+        )
+        return dict(zip(settings, results))
 
     async def torch(self, activate: bool = True) -> bool:
         """Enable/disable the torch."""
-        path = "/enabletorch" if activate else "/disabletorch"
-        response = await self._request(path)
-        return "Ok" in (await response.text())
+        return await self._ok_request(_TORCH_PATHS[activate])
 
     async def focus(self, activate: bool = True) -> bool:
         """Enable/disable camera focus."""
-        path = "/focus" if activate else "/nofocus"
-        response = await self._request(path)
-        return "Ok" in (await response.text())
+        return await self._ok_request(_FOCUS_PATHS[activate])
 
     async def record(self, record: bool = True, tag: Optional[str] = None) -> bool:
         """Enable/disable recording."""
-        path = "/startvideo?force=1" if record else "/stopvideo?force=1"
+        url = self._startvideo_url if record else self._stopvideo_url
         if record and tag is not None:
-            path = f"/startvideo?force=1&tag={URL(tag).raw_path}"
-        response = await self._request(path)
-        return "Ok" in (await response.text())
+            url = url.update_query(tag=tag)
+        return await self._ok_request(url)
 
     async def set_front_facing_camera(self, activate: bool = True) -> bool:
         """Enable/disable the front-facing camera."""
-        return await self.change_setting("ffc", activate)
+        return await self._bool_setting("ffc", activate)
 
     async def set_night_vision(self, activate: bool = True) -> bool:
         """Enable/disable night vision."""
-        return await self.change_setting("night_vision", activate)
+        return await self._bool_setting("night_vision", activate)
 
     async def set_overlay(self, activate: bool = True) -> bool:
         """Enable/disable the video overlay."""
-        return await self.change_setting("overlay", activate)
+        return await self._bool_setting("overlay", activate)
 
     async def set_gps_active(self, activate: bool = True) -> bool:
         """Enable/disable GPS."""
-        return await self.change_setting("gps_active", activate)
+        return await self._bool_setting("gps_active", activate)
 
     async def set_quality(self, quality: int = 100) -> bool:
         """Set the video quality."""
@@ -229,7 +611,7 @@ class PyDroidIPCam:
 
     async def set_motion_detect(self, activate: bool = True) -> bool:
         """Set motion detection on/off."""
-        return await self.change_setting("motion_detect", activate)
+        return await self._bool_setting("motion_detect", activate)
 
     async def set_orientation(self, orientation: str = "landscape") -> bool:
         """Set the video orientation."""
@@ -239,11 +621,17 @@ class PyDroidIPCam:
 
     async def set_zoom(self, zoom: int) -> bool:
         """Set the zoom level."""
-        response = await self._request(f"/settings/ptz?zoom={zoom}")
-        return "Ok" in (await response.text())
+        return await self._ok_request(self._ptz_url.with_query(zoom=zoom))
 
     async def set_scenemode(self, scenemode: str = "auto") -> bool:
         """Set the video scene mode."""
-        if scenemode not in self.available_settings["scenemode"]:
+        # Scene modes are plain strings, so validate against a frozenset
+        # of the raw status data instead of materializing
+        # available_settings; the set is rebuilt after each poll.
+        if self._scenemodes_cache is None:
+            self._scenemodes_cache = frozenset(
+                self.status_data.get("avail", {}).get("scenemode", ())
+            )
+        if scenemode not in self._scenemodes_cache:
             raise RuntimeError(f"Invalid scene mode {scenemode}")
         return await self.change_setting("scenemode", scenemode)
@@ -4,6 +4,13 @@
 class PyDroidIPCamException(Exception):
     """Base exception for PyDroidIPCam."""
 
+    def __str__(self) -> str:
+        # Raised as (code, message) for HTTP errors; format lazily so
+        # the raise path does not pay for it unless the text is read.
+        if len(self.args) == 2:
+            return f"code: {self.args[0]}, error: {self.args[1]}"
+        return super().__str__()
+
 
 class Unauthorized(PyDroidIPCamException):
     """Username or password is incorrect."""
@@ -25,6 +25,7 @@ setup(
     zip_safe=True,
     platforms="any",
     install_requires=REQUIRES,
+    extras_require={"fast": ["orjson"]},
     classifiers=[
         "Intended Audience :: Developers",
         "Operating System :: OS Independent",